@@ -18,9 +18,19 @@
     >>> print(args.config)  # None или Path('config.json')
 """
 
-import argparse
+import sys
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Sequence
+
+
+CONFIG_OPTION = '--config'
+CONFIG_OPTION_PREFIX = f'{CONFIG_OPTION}='
 
 
 @dataclass(frozen=True)
@@ -33,11 +43,50 @@ class CLIArgs:
 def parse_args() -> CLIArgs:
     """Разбирает аргументы командной строки.
 
+    Типовые вызовы (без аргументов, `--config PATH`, `--config=PATH`) разбираются напрямую,
+    без импорта и настройки `argparse`. Остальные случаи, включая `--help` и ошибки,
+    обрабатывает `argparse`.
+
     Returns:
         CLIArgs: Объект с разобранными аргументами.
     """
+    argv = sys.argv[1:]
+
+    match argv:
+        case []:
+            return CLIArgs(config=None)
+        case [option] if option.startswith(CONFIG_OPTION_PREFIX) and option != CONFIG_OPTION_PREFIX:
+            return CLIArgs(config=Path(option.removeprefix(CONFIG_OPTION_PREFIX)))
+        case [option, value] if option == CONFIG_OPTION and not value.startswith('-'):
+            return CLIArgs(config=Path(value))
+
+    return _parse_args_with_argparse(argv)
+
+
+@cache
+def _build_parser() -> 'argparse.ArgumentParser':
+    """Создает парсер аргументов командной строки.
+
+    Парсер создается один раз за процесс и переиспользуется при повторных вызовах `parse_args`.
+
+    Returns:
+        argparse.ArgumentParser: Настроенный парсер аргументов.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(description='Nginx Log Analyzer')
-    parser.add_argument('--config', type=Path, help='Путь к файлу конфигурации')
+    parser.add_argument(CONFIG_OPTION, type=Path, help='Путь к файлу конфигурации')
+    return parser
+
+
+def _parse_args_with_argparse(argv: 'Sequence[str]') -> CLIArgs:
+    """Разбирает аргументы командной строки с помощью `argparse`.
 
-    args = parser.parse_args()
+    Args:
+        argv (Sequence[str]): Аргументы командной строки без имени программы.
+
+    Returns:
+        CLIArgs: Объект с разобранными аргументами.
+    """
+    args = _build_parser().parse_args(argv)
     return CLIArgs(config=args.config)
@@ -9,7 +9,6 @@
     ConfigModel: Основной класс конфигурации.
 """
 
-import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -18,15 +17,23 @@ if TYPE_CHECKING:
     from typing import Any
 
 
-DEFAULT_LOG_DIR = Path().absolute().joinpath('logs')
-DEFAULT_REPORT_DIR = Path().absolute().joinpath('reports')
+# Текущая директория запрашивается один раз (`os.getcwd()`), а не для каждого значения по умолчанию.
+_CWD = Path.cwd()
+
+DEFAULT_LOG_DIR = _CWD / 'logs'
+DEFAULT_REPORT_DIR = _CWD / 'reports'
 DEFAULT_REPORT_SIZE = 1000
 DEFAULT_ERROR_THRESHOLD = 0.1
 DEFAULT_REPORT_TEMPLATE_FILENAME = 'report.html'
-DEFAULT_REPORT_TEMPLATE_PATH = Path().absolute().joinpath(DEFAULT_REPORT_TEMPLATE_FILENAME)
+DEFAULT_REPORT_TEMPLATE_PATH = _CWD / DEFAULT_REPORT_TEMPLATE_FILENAME
+
 
+def _as_path(value: str | Path) -> Path:
+    """Возвращает `value` как `Path`, не разбирая заново уже готовый путь."""
+    return value if isinstance(value, Path) else Path(value)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ConfigModel:
     """Конфигурация лог-анализатора.
 
@@ -61,13 +68,17 @@ class ConfigModel:
             log_file=cls._validate_log_file(config_data.get('log_file')),
             report_dir=cls._validate_directory(config_data.get('report_dir', DEFAULT_REPORT_DIR), 'report_dir'),
             report_size=cls._validate_report_size(config_data.get('report_size', DEFAULT_REPORT_SIZE)),
-            report_template_path=cls.report_template_path,
+            report_template_path=DEFAULT_REPORT_TEMPLATE_PATH,
         )
 
     @classmethod
     def from_toml(cls, config_path: Path) -> 'ConfigModel':
         """Загружает конфигурацию из TOML-файла.
 
+        Повторный вызов для неизмененного файла (те же время изменения и размер) не разбирает
+        TOML заново. Валидация выполняется при каждом вызове: каталоги, удаленные после первой
+        загрузки, по-прежнему обнаруживаются.
+
         Args:
             config_path (Path): Путь к TOML файлу.
 
@@ -78,15 +89,64 @@ class ConfigModel:
             FileNotFoundError: Если файл не найден.
             ValueError: Если TOML некорректен.
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f'Файл конфигурации {config_path} не найден.')
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f'Файл конфигурации {config_path} не найден.') from error
+
+        # Размер дополняет время изменения: правка в пределах точности mtime обычно меняет и его
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        cached = _TOML_CACHE.get(config_path)
+        if cached is not None and cached[0] == fingerprint:
+            config_data = cached[1]
+        else:
+            config_data = cls._read_toml(config_path)
+            _TOML_CACHE[config_path] = (fingerprint, config_data)
+        return cls._from_toml_data(config_path, config_data)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Очищает кэш разобранных TOML-файлов конфигурации."""
+        _TOML_CACHE.clear()
+
+    @staticmethod
+    def _read_toml(config_path: Path) -> dict[str, 'Any']:
+        """Разбирает TOML-файл конфигурации.
+
+        Args:
+            config_path (Path): Путь к TOML файлу.
+
+        Returns:
+            dict[str, Any]: Разобранные параметры конфигурации.
+
+        Raises:
+            ValueError: Если TOML некорректен.
+        """
+        # `tomllib` нужен только при запуске с файлом конфигурации, поэтому импортируется здесь
+        import tomllib
 
         with config_path.open('rb') as f:
             try:
-                config_data = tomllib.load(f)
+                return tomllib.load(f)
             except tomllib.TOMLDecodeError as error:
                 raise ValueError(f'Ошибка при разборе TOML: {error}') from error
 
+    @classmethod
+    def _from_toml_data(cls, config_path: Path, config_data: dict[str, 'Any']) -> 'ConfigModel':
+        """Валидирует параметры из TOML-файла и создает объект настроек.
+
+        Относительные пути отсчитываются от каталога файла конфигурации.
+
+        Args:
+            config_path (Path): Путь к TOML файлу.
+            config_data (dict[str, Any]): Разобранные параметры конфигурации.
+
+        Returns:
+            ConfigModel: Загруженная конфигурация.
+
+        Raises:
+            ValueError: Если параметры не проходят валидацию.
+        """
         config_dir = config_path.parent
         log_dir = config_dir / config_data.get('log_dir', 'logs')
         report_dir = config_dir / config_data.get('report_dir', 'reports')
@@ -105,7 +165,7 @@ class ConfigModel:
             log_file=log_file,
             report_dir=cls._validate_directory(report_dir, 'report_dir'),
             report_size=cls._validate_report_size(report_size),
-            report_template_path=cls.report_template_path,
+            report_template_path=DEFAULT_REPORT_TEMPLATE_PATH,
         )
 
     @staticmethod
@@ -122,7 +182,7 @@ class ConfigModel:
         Raises:
             ValueError: Если директория не существует.
         """
-        path = Path(value).resolve()
+        path = _as_path(value).resolve()
         if not path.is_dir():
             raise ValueError(f'{folder_name} должен быть существующей директорией: {path}')
         return path
@@ -142,7 +202,7 @@ class ConfigModel:
         """
         if value is None:
             return None
-        path = Path(value).resolve()
+        path = _as_path(value).resolve()
         if not path.is_file():
             raise ValueError(f'log_file должен быть существующим файлом: {path}')
         return path
@@ -183,6 +243,7 @@ class ConfigModel:
 
 
 _CONFIG_CONTAINER: dict[str, 'ConfigModel'] = {}
+_TOML_CACHE: dict[Path, tuple[tuple[int, int], dict[str, 'Any']]] = {}
 
 
 def set_config(config: 'ConfigModel') -> None:
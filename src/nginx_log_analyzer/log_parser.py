@@ -8,7 +8,8 @@
 
 Структура логов:
 - Поддерживается стандартный формат access.log в Nginx.
-- Формат строки лога должен соответствовать регулярному выражению `LOG_LINE_PATTERN`.
+- Строка лога должна содержать строку запроса и завершаться полем request_time
+  (см. регулярное выражение `LOG_LINE_PATTERN`).
 
 Классы:
     LogFileType (Enum):
@@ -20,26 +21,44 @@
         - Дата из имени файла.
         - Тип файла (обычный или сжатый).
 
+    ParsedLogEntry (NamedTuple):
+        Именованная форма записи (URL, request_time).
+
 Функции:
     find_latest_log:
         Ищет самый свежий лог-файл в указанной директории.
 
     unzip_if_needed:
-        Читает строки лога, разархивируя `.gz`, если требуется.
+        Читает строки лога в бинарном виде, разархивируя `.gz`, если требуется.
+
+    parse_line:
+        Разбирает одну строку лога срезами, используя регулярное выражение как запасной вариант.
 
     parse_log:
         Разбирает строки лога, извлекая URL и request_time.
         Контролирует процент ошибок, выбрасывая исключение при превышении порога.
 
+    parse_log_parallel:
+        Разбирает несжатый лог-файл в нескольких процессах, группируя request_time по URL.
+
 Константы:
+    GZIP_READ_BUFFER_SIZE (int):
+        Размер буфера построчного чтения распакованных данных `.gz` файла.
+
+    PARALLEL_MIN_FILE_SIZE (int):
+        Минимальный размер несжатого лог-файла, начиная с которого его стоит разбирать параллельно.
+
+    LOG_FILENAME_PREFIX (str):
+        Общий префикс имен лог-файлов Nginx, отсекающий посторонние файлы до проверки регулярным выражением.
+
     LOG_FILENAME_PATTERN (Pattern):
         Регулярное выражение для поиска лог-файлов Nginx с датами.
 
-    LOG_LINE_PATTERN (Pattern):
-        Регулярное выражение для разбора строк лога.
+    HTTP_METHODS (frozenset):
+        Допустимые HTTP-методы в строке запроса.
 
-    ParsedLogEntry (namedtuple):
-        Структура данных для хранения распарсенных URL и request_time.
+    LOG_LINE_PATTERN (Pattern):
+        Регулярное выражение для извлечения URL и request_time, если строку не удалось разобрать срезами.
 
 Исключения:
     ValueError:
@@ -55,38 +74,41 @@
 """
 
 import gzip
+import io
+import mmap
+import os
 import re
-from collections import namedtuple
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import NamedTuple, TYPE_CHECKING
 
 from src.nginx_log_analyzer.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
     from pathlib import Path
 
 
 logger = get_logger()
 
+# Для файлов меньше этого размера запуск процессов обходится дороже самого разбора
+PARALLEL_MIN_FILE_SIZE = 50 * 1024 * 1024
+GZIP_READ_BUFFER_SIZE = 1024 * 1024
+LOG_FILENAME_PREFIX = 'nginx-access-ui.log-'
 LOG_FILENAME_PATTERN = re.compile(r'nginx-access-ui\.log-(\d{8})(\.gz)?$')
+HTTP_METHODS = frozenset((b'GET', b'POST', b'PUT', b'DELETE', b'PATCH', b'OPTIONS', b'HEAD'))
+
+# Притяжательные квантификаторы (`++`, `*+`, Python 3.11+) не возвращают захваченные символы,
+# поэтому на поврежденных строках регулярное выражение не уходит в перебор с возвратами.
+# Шаблон привязан к началу строки и применяется через `match`: строка запроса — первое поле
+# в кавычках, и искать ее на других позициях не нужно. Завершающий `\s*+$` поглощает
+# перевод строки, так что обрезать строку перед разбором не требуется.
 LOG_LINE_PATTERN = re.compile(
-    r'(?P<remote_addr>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'  # IP Address
-    r'(?P<remote_user>-|\S+)\s+'  # Remote User (can be "-")
-    r'(?P<http_x_real_ip>-|\S+)\s+'  # X-Real-IP (can be "-")
-    r'\[(?P<time_local>[^\]]+)]\s+'  # Time Local
-    r'"(?P<method>GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD)\s+'  # HTTP Method
-    r'(?P<url>\S+)\s+HTTP/\d+\.\d+"\s+'  # URL and HTTP version
-    r'(?P<status>\d{3})\s+'  # HTTP Status Code
-    r'(?P<body_bytes_sent>\d+|-)\s+'  # Bytes sent (or "-")
-    r'"(?P<http_referer>[^"]*)"\s+'  # Referer (optional)
-    r'"(?P<http_user_agent>[^"]*)"\s+'  # User-Agent (optional)
-    r'"(?P<http_x_forwarded_for>[^"]*)"\s+'  # X-Forwarded-For (optional)
-    r'"(?P<http_x_request_id>[^"]*)"\s+'  # X-Request-ID (optional)
-    r'"(?P<http_x_rb_user>[^"]*)"\s*'  # X-RB-User (optional)
-    r'(?P<request_time>\d+\.\d+)?'  # Request time (optional, at the end)
+    rb'[^"]*+"(?:GET|POST|PUT|DELETE|PATCH|OPTIONS|HEAD) (\S++) HTTP/[^"]++"'  # HTTP Method, URL and HTTP version
+    rb'.*\s(\d++\.\d++)\s*+$',  # Request time (last field)
+    re.DOTALL,
 )
 
 
@@ -115,48 +137,124 @@ def find_latest_log(log_dir: 'Path') -> LogFileMetadata | None:
     Returns:
         LogFileMetadata | None: Метаданные найденного файла или None, если файлы не найдены.
     """
-    log_files = []
-
-    for file in log_dir.iterdir():
-        match = LOG_FILENAME_PATTERN.match(file.name)
-
-        if match:
-            date_str, gz_ext = match.groups()
-            log_date = datetime.strptime(date_str, '%Y%m%d')
-            file_type = LogFileType.GZ if gz_ext else LogFileType.PLAIN
-            log_files.append(LogFileMetadata(file, log_date, file_type))
+    latest_name: str | None = None
+    latest_match: re.Match[str] | None = None
+
+    # Дата в имени файла имеет вид YYYYMMDD, поэтому строки сравниваются как даты.
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(LOG_FILENAME_PREFIX):
+                continue
+
+            # `DirEntry.is_file()` обычно отвечает по данным `scandir`, без отдельного `stat()`
+            match = LOG_FILENAME_PATTERN.match(name)
+            if match and (latest_match is None or match.group(1) > latest_match.group(1)) and entry.is_file():
+                latest_name, latest_match = name, match
+
+    if latest_name is None or latest_match is None:
+        return None
 
-    return max(log_files, key=lambda log_meta: log_meta.date) if log_files else None
+    date_str, gz_ext = latest_match.groups()
+    log_date = datetime.strptime(date_str, '%Y%m%d')
+    file_type = LogFileType.GZ if gz_ext else LogFileType.PLAIN
+    return LogFileMetadata(log_dir / latest_name, log_date, file_type)
 
 
-def unzip_if_needed(log_path: 'Path') -> 'Generator[str, None, None]':
+def unzip_if_needed(log_path: 'Path') -> 'Generator[bytes, None, None]':
     """Распаковывает сжатый `.gz` файл, если это необходимо.
 
+    Файл читается в бинарном режиме: из строки нужны только URL и request_time,
+    поэтому декодировать всю строку целиком нет смысла. Несжатый файл отображается
+    в память (`mmap`), и строки читаются из страничного кэша без промежуточного буфера.
+
     Args:
         log_path (Path): Путь к файлу журнала.
 
     Yields:
-        str: Построчное содержимое файла.
+        bytes: Построчное содержимое файла.
     """
     if log_path.suffix == '.gz':
-        with gzip.open(log_path, 'rt', encoding='utf-8') as f:
-            yield from f
-    else:
-        with log_path.open(encoding='utf-8') as f:
+        # Построчная итерация по `GzipFile` идет через Python-обертку `readline`;
+        # поверх `io.BufferedReader` строки нарезаются целиком на уровне C.
+        with (
+            gzip.open(log_path, 'rb') as raw,
+            # `GzipFile` не `RawIOBase`, но `BufferedReader` нужен только `readinto`, который у него есть
+            io.BufferedReader(raw, GZIP_READ_BUFFER_SIZE) as f,  # type: ignore[arg-type]
+        ):
             yield from f
+        return
+
+    with log_path.open('rb') as f:
+        # Пустой файл нельзя отобразить в память
+        if not os.fstat(f.fileno()).st_size:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield from iter(mapped.readline, b'')
+
+
+class ParsedLogEntry(NamedTuple):
+    """Распарсенная запись лога.
+
+    `parse_line` и `parse_log` отдают обычные кортежи `(url, request_time)` той же формы:
+    создание кортежа заметно дешевле, чем создание `NamedTuple` на каждую строку.
+    """
+
+    url: str
+    request_time: float
 
 
-ParsedLogEntry = namedtuple('ParsedLogEntry', ['url', 'request_time'])
+def parse_line(line: bytes) -> tuple[str, float] | None:
+    """Разбирает одну строку лога, извлекая URL и request_time.
+
+    В формате Nginx строка запроса — первое поле в кавычках, а request_time — последнее
+    поле строки, поэтому обычно хватает срезов по кавычкам и пробелам. Регулярное
+    выражение `LOG_LINE_PATTERN` применяется, только если такой разбор не удался.
+
+    Args:
+        line (bytes): Строка лога.
+
+    Returns:
+        tuple[str, float] | None: Кортеж (URL, request_time) или None, если строка некорректна.
+    """
+    try:
+        method, url, protocol = line.split(b'"', 2)[1].split(b' ')
+    except (IndexError, ValueError):
+        pass
+    else:
+        # `float` принял бы и `nan`, и `1e3`, и размер ответа обрезанной строки, поэтому
+        # request_time проверяется на тот же вид `\d+\.\d+`, что и в `LOG_LINE_PATTERN`
+        request_time = line.rpartition(b' ')[2].rstrip()
+        integer, _, fraction = request_time.partition(b'.')
+        if (
+            url
+            and method in HTTP_METHODS
+            and protocol.startswith(b'HTTP/')
+            and integer.isdigit()
+            and fraction.isdigit()
+        ):
+            return url.decode('utf-8', 'replace'), float(request_time)
+
+    match = LOG_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    return match.group(1).decode('utf-8', 'replace'), float(match.group(2))
 
 
 def parse_log(
-    log_file: 'Generator[str, None, None]',
+    log_file: 'Iterable[bytes]',
     error_threshold: float,
-) -> 'Generator[ParsedLogEntry, None, None]':
+) -> 'Generator[tuple[str, float], None, None]':
     """Разбирает строки лога, извлекая URL и request_time.
 
+    Записи отдаются по мере разбора, без накопления в памяти. Порог ошибок
+    проверяется после чтения последней строки.
+
     Args:
-        log_file (Generator[str, None, None]): Генератор строк файла лога.
+        log_file (Iterable[bytes]): Строки файла лога.
         error_threshold (float): Порог допустимого процента ошибок разбора.
 
     Yields:
@@ -167,25 +265,33 @@ def parse_log(
     """
     errors = 0
     total_lines = 0
-    parsed_entries: list[ParsedLogEntry] = []
 
     for line in log_file:
         total_lines += 1
-        match = LOG_LINE_PATTERN.match(line.strip())
-
-        if match:
-            parsed_entries.append(
-                ParsedLogEntry(
-                    url=match.group('url'),
-                    request_time=float(match.group('request_time')),
-                )
-            )
-        else:
+        entry = parse_line(line)
+
+        if entry is None:
             errors += 1
+        else:
+            yield entry
+
+    _check_errors(total_lines, errors, error_threshold)
+
+
+def _check_errors(total_lines: int, errors: int, error_threshold: float) -> None:
+    """Проверяет процент ошибок разбора и логирует итог.
+
+    Args:
+        total_lines (int): Количество прочитанных строк.
+        errors (int): Количество строк, которые не удалось разобрать.
+        error_threshold (float): Порог допустимого процента ошибок разбора.
 
+    Raises:
+        ValueError: Если процент ошибок превышает `error_threshold`.
+    """
     if total_lines == 0:
         logger.warning('Empty log file provided')
-        return None
+        return
 
     error_rate = errors / total_lines
 
@@ -199,4 +305,129 @@ def parse_log(
         )
         raise ValueError(f'Превышен порог ошибок при разборе логов: {error_rate:.2%} (допустимо {error_threshold:.2%})')
 
-    yield from parsed_entries
+    logger.info('Лог-файл разобран', total_lines=total_lines, errors=errors)
+
+
+def _chunk_bounds(mapped: mmap.mmap, parts: int) -> list[tuple[int, int]]:
+    """Делит отображенный файл на диапазоны байтов, границы которых совпадают с концами строк.
+
+    Args:
+        mapped (mmap.mmap): Отображенный в память лог-файл.
+        parts (int): Желаемое количество диапазонов.
+
+    Returns:
+        list[tuple[int, int]]: Непустые диапазоны `(start, end)`, покрывающие весь файл.
+    """
+    size = len(mapped)
+    bounds = [0]
+    for part in range(1, parts):
+        newline = mapped.find(b'\n', max(size * part // parts, bounds[-1]))
+        if newline == -1:
+            break
+        bounds.append(newline + 1)
+    bounds.append(size)
+
+    return [(start, end) for start, end in zip(bounds, bounds[1:], strict=False) if start < end]
+
+
+def _parse_chunk(log_path: 'Path', start: int, end: int) -> tuple[dict[str, 'array[float]'], int, int]:
+    """Разбирает строки лог-файла в диапазоне байтов `[start, end)`.
+
+    Выполняется в дочернем процессе, поэтому возвращает только сгруппированные значения
+    request_time, а порог ошибок проверяет вызывающая сторона.
+
+    Args:
+        log_path (Path): Путь к несжатому лог-файлу.
+        start (int): Смещение начала первой строки диапазона.
+        end (int): Смещение конца диапазона.
+
+    Returns:
+        tuple[dict[str, array[float]], int, int]: Значения request_time по URL,
+            количество прочитанных строк и количество ошибок разбора.
+    """
+    times_by_url: dict[str, array[float]] = {}
+    total_lines = 0
+    errors = 0
+
+    with log_path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        mapped.seek(start)
+        readline = mapped.readline
+        position = start
+
+        while position < end:
+            line = readline()
+            # Файл мог быть усечен или заменен после вычисления границ диапазонов
+            if not line:
+                break
+            position += len(line)
+            total_lines += 1
+
+            entry = parse_line(line)
+            if entry is None:
+                errors += 1
+                continue
+
+            url, request_time = entry
+            times = times_by_url.get(url)
+            if times is None:
+                times = times_by_url[url] = array('d')
+            times.append(request_time)
+
+    return times_by_url, total_lines, errors
+
+
+def parse_log_parallel(
+    log_path: 'Path',
+    error_threshold: float,
+    processes: int | None = None,
+) -> dict[str, 'array[float]']:
+    """Разбирает несжатый лог-файл в нескольких процессах.
+
+    Файл делится на диапазоны по границам строк, каждый процесс разбирает свой диапазон
+    и группирует request_time по URL, после чего частичные результаты объединяются.
+    Имеет смысл для файлов от `PARALLEL_MIN_FILE_SIZE`: на небольших файлах запуск
+    процессов обходится дороже последовательного `parse_log`.
+
+    Args:
+        log_path (Path): Путь к несжатому лог-файлу.
+        error_threshold (float): Порог допустимого процента ошибок разбора.
+        processes (int | None): Количество процессов. По умолчанию по числу процессоров.
+
+    Returns:
+        dict[str, array[float]]: Значения request_time по URL в порядке появления URL.
+
+    Raises:
+        ValueError: Если процент ошибок превышает `error_threshold`.
+    """
+    processes = processes or os.cpu_count() or 1
+    bounds: list[tuple[int, int]] = []
+
+    with log_path.open('rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                bounds = _chunk_bounds(mapped, processes)
+
+    times_by_url: dict[str, array[float]] = {}
+    total_lines = 0
+    errors = 0
+
+    if bounds:
+        # `multiprocessing` импортируется только здесь: на последовательном пути он не нужен,
+        # а его импорт заметно замедляет запуск CLI
+        from multiprocessing import Pool
+
+        with Pool(min(processes, len(bounds))) as pool:
+            results = pool.starmap(_parse_chunk, [(log_path, start, end) for start, end in bounds])
+
+        for chunk_times, chunk_lines, chunk_errors in results:
+            total_lines += chunk_lines
+            errors += chunk_errors
+            for url, times in chunk_times.items():
+                merged = times_by_url.get(url)
+                if merged is None:
+                    times_by_url[url] = times
+                else:
+                    merged.extend(times)
+
+    _check_errors(total_lines, errors, error_threshold)
+    return times_by_url
@@ -27,12 +27,24 @@ class LogLevel(Enum):
     error = 'error'
 
 
+# Состояние настройки логирования хранится в словаре, а не в `global`-переменной,
+# так же как конфигурация в `config._CONFIG_CONTAINER`
+_LOGGING_STATE: dict[str, bool] = {'configured': False}
+
+
 def configure_logging(log_file: 'Path | None') -> None:
     """Настраивает Structlog-логгер с JSON-выводом.
 
+    Настройка выполняется не более одного раза за процесс: повторные вызовы, в том числе
+    с другим `log_file`, ничего не делают — не переустанавливают `sys.excepthook`,
+    не добавляют обработчики и не вызывают `structlog.configure`.
+
     Args:
         log_file: Путь до файла, куда будет записывать логи.
     """
+    if _LOGGING_STATE['configured']:
+        return
+    _LOGGING_STATE['configured'] = True
 
     def handle_exception(
         exc_type: 'type[BaseException]', exc_value: BaseException, exc_traceback: 'TracebackType | None'
@@ -15,10 +15,17 @@ from contextlib import closing
 
 from src.nginx_log_analyzer.cli import parse_args
 from src.nginx_log_analyzer.config import ConfigModel, set_config
-from src.nginx_log_analyzer.log_parser import find_latest_log, parse_log, unzip_if_needed
+from src.nginx_log_analyzer.log_parser import (
+    find_latest_log,
+    LogFileType,
+    PARALLEL_MIN_FILE_SIZE,
+    parse_log,
+    parse_log_parallel,
+    unzip_if_needed,
+)
 from src.nginx_log_analyzer.logger import configure_logging, get_logger
 from src.nginx_log_analyzer.report_generator import generate_report
-from src.nginx_log_analyzer.stats_calculator import calculate_statistics
+from src.nginx_log_analyzer.stats_calculator import calculate_statistics, calculate_statistics_from_times
 
 
 def main() -> None:
@@ -47,22 +54,25 @@ def main() -> None:
 
     # 4. Открываем лог-файл и анализируем его
     try:
-        with closing(unzip_if_needed(log_metadata.path)) as log_file:
-            parsed_entries = list(parse_log(log_file, error_threshold=config.error_threshold))
-
-        if not parsed_entries:
+        if log_metadata.file_type is LogFileType.PLAIN and log_metadata.path.stat().st_size >= PARALLEL_MIN_FILE_SIZE:
+            # 5. Большой несжатый файл разбираем в нескольких процессах
+            report_data = calculate_statistics_from_times(
+                parse_log_parallel(log_metadata.path, error_threshold=config.error_threshold),
+                report_size=config.report_size,
+            )
+        else:
+            with closing(unzip_if_needed(log_metadata.path)) as log_file:
+                # 5. Рассчитываем статистику за один проход, оставляя только `report_size` URL для отчета
+                report_data = calculate_statistics(
+                    parse_log(log_file, error_threshold=config.error_threshold),
+                    report_size=config.report_size,
+                )
+
+        if not report_data:
             logger.warning('Файл журнала пуст, отчет не будет создан')
             sys.exit(0)
 
-        logger.info(f'Успешно обработано {len(parsed_entries)} записей')
-
-        # 5. Рассчитываем статистику
-        statistics = calculate_statistics(parsed_entries)
-
-        # 6. Ограничиваем размер отчета
-        report_data = statistics[: config.report_size]
-
-        # 7. Генерируем отчет
+        # 6. Генерируем отчет
         generate_report(report_data, report_path, config.report_template_path)
         logger.info('Отчет успешно создан', report_path=str(report_path), report_name=report_filename)
 
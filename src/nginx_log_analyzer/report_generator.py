@@ -7,23 +7,53 @@
 """
 
 import json
-import string
-from pathlib import Path
+import os
+import tempfile
 from typing import TYPE_CHECKING
 
 from src.nginx_log_analyzer.logger import get_logger
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
 
     from src.nginx_log_analyzer.stats_calculator import StatisticEntry
 
 
 logger = get_logger()
-REPORT_TEMPLATE_PATH = Path().absolute().joinpath('report.html')
+TABLE_JSON_PLACEHOLDER = b'$table_json'
 
+_TEMPLATE_CACHE: dict['Path', tuple[tuple[int, int], tuple[bytes, bytes, bytes]]] = {}
 
-def generate_report(data: 'Sequence[StatisticEntry]', report_path: Path, template_path: Path) -> None:
+
+def _load_template(template_path: 'Path') -> tuple[bytes, bytes, bytes]:
+    """Читает HTML-шаблон и делит его по месту подстановки данных.
+
+    Результат кэшируется по пути и отпечатку файла (время изменения и размер), как и
+    TOML-конфигурация в `ConfigModel.from_toml`: неизмененный шаблон не читается с диска
+    заново, а измененный — перечитывается.
+
+    Args:
+        template_path: Путь к HTML-шаблону отчета.
+
+    Returns:
+        tuple[bytes, bytes, bytes]: Часть до `TABLE_JSON_PLACEHOLDER`, сам заполнитель и часть после него.
+
+    Raises:
+        FileNotFoundError: Если шаблон не найден.
+    """
+    stat = template_path.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    parts = template_path.read_bytes().partition(TABLE_JSON_PLACEHOLDER)
+    _TEMPLATE_CACHE[template_path] = (fingerprint, parts)
+    return parts
+
+
+def generate_report(data: 'Sequence[StatisticEntry]', report_path: 'Path', template_path: 'Path') -> None:
     """Генерирует HTML-отчет и сохраняет его в файл.
 
     Args:
@@ -31,20 +61,36 @@ def generate_report(data: 'Sequence[StatisticEntry]', report_path: Path, templat
         report_path: Путь для сохранения отчета.
         template_path: Путь к HTML-шаблону отчета.
     """
-    if not template_path.exists():
+    # Читаем HTML-шаблон (повторно — только если файл изменился) без отдельной проверки существования
+    try:
+        prefix, placeholder, suffix = _load_template(template_path)
+    except FileNotFoundError as error:
         logger.error('Шаблон отчета не найден', path=str(template_path))
-        raise FileNotFoundError(f'Шаблон отчета отсутствует: {template_path}')
-
-    # Читаем HTML-шаблон
-    template_content = template_path.read_text(encoding='utf-8')
+        raise FileNotFoundError(f'Шаблон отчета отсутствует: {template_path}') from error
 
-    # Формируем JSON для вставки в отчет
-    table_json = json.dumps(data, ensure_ascii=False, indent=2)
+    # Формируем JSON для вставки в отчет. Без `indent` `json.dumps` использует C-кодировщик,
+    # а отступы в данных для JavaScript не нужны.
+    table_json = json.dumps(data, ensure_ascii=False).encode('utf-8')
 
-    # Используем string.Template для безопасного подстановки данных
-    template = string.Template(template_content)
-    report_html = template.safe_substitute(table_json=table_json)
+    # Сохраняем отчет по частям, не собирая итоговый HTML в одну строку. Запись идет во временный
+    # файл, который затем атомарно заменяет отчет: недописанный отчет не должен появиться под
+    # итоговым именем, иначе следующий запуск сочтет его готовым и пропустит повторную генерацию.
+    # Имя временного файла уникально, поэтому параллельные запуски не затирают и не удаляют
+    # временные файлы друг друга.
+    with tempfile.NamedTemporaryFile(
+        dir=report_path.parent, prefix=report_path.name, suffix='.tmp', delete=False
+    ) as report_file:
+        try:
+            report_file.write(prefix)
+            if placeholder:
+                report_file.write(table_json)
+            report_file.write(suffix)
+            # Файл закрывается до переименования и удаления: открытый файл не везде можно заменить
+            report_file.close()
+            os.replace(report_file.name, report_path)
+        except BaseException:
+            report_file.close()
+            os.unlink(report_file.name)
+            raise
 
-    # Сохраняем отчет
-    report_path.write_text(report_html, encoding='utf-8')
     logger.info('Отчет успешно сохранен', report_path=str(report_path))
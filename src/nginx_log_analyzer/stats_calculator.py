@@ -1,6 +1,6 @@
 """Модуль вычисления статистики логов.
 
-Этот модуль принимает распарсенные данные (URL, request_time) и вычисляет:
+Этот модуль за один проход по распарсенным данным (URL, request_time) вычисляет:
 - Общее количество запросов на URL.
 - Процентное соотношение количества запросов.
 - Суммарное, среднее, максимальное и медианное время запросов.
@@ -14,20 +14,22 @@
     calculate_statistics:
         Вычисляет статистику по данным логов.
 
+    calculate_statistics_from_times:
+        Вычисляет статистику по значениям request_time, уже сгруппированным по URL.
+
 Пример использования:
     >>> parsed_logs = [('/api/data', 0.200), ('/api/data', 0.300), ('/api/info', 0.150)]
     >>> statistics = calculate_statistics(parsed_logs)
     >>> print(statistics[0])  # Первая запись статистики
 """
 
+import heapq
+from array import array
 from dataclasses import dataclass, field
-from statistics import median
 from typing import TYPE_CHECKING, TypedDict
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-
-    from src.nginx_log_analyzer.log_parser import ParsedLogEntry
+    from collections.abc import Iterable, Mapping, Sequence
 
 
 class StatisticEntry(TypedDict):
@@ -43,68 +45,203 @@ class StatisticEntry(TypedDict):
     time_med: float
 
 
+def _median(values: 'Sequence[float]') -> float:
+    """Возвращает медиану значений или 0.0 для пустой последовательности.
+
+    Значения сортируются один раз встроенным `sorted`, без импорта модуля `statistics`.
+    Для одного, двух и трех значений медиана вычисляется напрямую, без сортировки:
+    у большинства URL в логе всего несколько запросов.
+    """
+    size = len(values)
+    match size:
+        case 0:
+            return 0.0
+        case 1:
+            return values[0]
+        case 2:
+            return (values[0] + values[1]) / 2
+        case 3:
+            first, second, third = values
+            return max(min(first, second), min(max(first, second), third))
+
+    ordered = sorted(values)
+    middle = size // 2
+    return ordered[middle] if size % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def _percent_scale(total: float) -> float:
+    """Возвращает множитель для перевода доли от `total` в проценты или 0.0 для нулевой суммы."""
+    return 100.0 / total if total else 0.0
+
+
+def _statistic_entry(
+    url: str,
+    count: int,
+    time_sum: float,
+    time_max: float,
+    time_med: float,
+    scales: tuple[float, float],
+) -> StatisticEntry:
+    """Собирает итоговую запись статистики для одного URL.
+
+    Множители `scales` — для количества и для времени (см. `_percent_scale`) — одинаковы
+    для всех URL и вычисляются один раз, поэтому проценты считаются умножением,
+    без деления и проверки на ноль для каждого URL.
+    """
+    count_scale, time_scale = scales
+    return StatisticEntry(
+        url=url,
+        count=count,
+        count_perc=count * count_scale,
+        time_sum=time_sum,
+        time_perc=time_sum * time_scale,
+        time_avg=time_sum / count if count else 0.0,
+        time_max=time_max,
+        time_med=time_med,
+    )
+
+
 @dataclass
 class URLStatistic:
-    """Хранит и обрабатывает статистику запросов для конкретного URL."""
+    """Хранит и обрабатывает статистику запросов для конкретного URL.
+
+    Количество, сумма и максимум времени обновляются инкрементально. Для медианы значения
+    хранятся в двух кучах: `_lo` — меньшая половина (max-куча на отрицательных значениях),
+    `_hi` — большая половина (min-куча). Добавление стоит O(log n), чтение медианы — O(1).
+    """
 
     url: str
     count: int = 0
     time_sum: float = 0.0
-    times: list[float] = field(default_factory=list)
+    time_max: float = 0.0
+    _lo: list[float] = field(default_factory=list, init=False, repr=False)
+    _hi: list[float] = field(default_factory=list, init=False, repr=False)
 
     def add_request(self, request_time: float) -> None:
         """Добавляет данные о запросе в статистику."""
         self.count += 1
         self.time_sum += request_time
-        self.times.append(request_time)
+        self.time_max = max(self.time_max, request_time)
 
-    @property
-    def time_max(self) -> float:
-        """Возвращает максимальное время запроса."""
-        return max(self.times) if self.times else 0.0
+        lo, hi = self._lo, self._hi
+        if not lo or request_time <= -lo[0]:
+            heapq.heappush(lo, -request_time)
+        else:
+            heapq.heappush(hi, request_time)
+
+        # Половины выравниваются так, чтобы в `_lo` было столько же значений или на одно больше
+        if len(lo) > len(hi) + 1:
+            heapq.heappush(hi, -heapq.heappop(lo))
+        elif len(hi) > len(lo):
+            heapq.heappush(lo, -heapq.heappop(hi))
 
     @property
     def time_median(self) -> float:
         """Возвращает медианное время запроса."""
-        return median(self.times) if self.times else 0.0
+        lo, hi = self._lo, self._hi
+        if not lo:
+            return 0.0
+        if len(lo) > len(hi):
+            return -lo[0]
+        return (-lo[0] + hi[0]) / 2
 
     def compute_metrics(self, total_requests: int, total_time: float) -> StatisticEntry:
         """Вычисляет метрики для данного URL."""
-        return StatisticEntry(
-            url=self.url,
-            count=self.count,
-            count_perc=(self.count / total_requests) * 100 if total_requests else 0.0,
-            time_sum=self.time_sum,
-            time_perc=(self.time_sum / total_time) * 100 if total_time else 0.0,
-            time_avg=self.time_sum / self.count if self.count else 0.0,
-            time_max=max(self.times) if self.times else 0.0,
-            time_med=median(self.times) if self.times else 0.0,
+        return _statistic_entry(
+            self.url,
+            self.count,
+            self.time_sum,
+            self.time_max,
+            self.time_median,
+            (_percent_scale(total_requests), _percent_scale(total_time)),
         )
 
 
-def calculate_statistics(data: 'Sequence[ParsedLogEntry]') -> 'Sequence[StatisticEntry]':
+def calculate_statistics(
+    data: 'Iterable[tuple[str, float]]',
+    report_size: int | None = None,
+) -> 'Sequence[StatisticEntry]':
     """Вычисляет статистику по данным логов.
 
+    Данные читаются за один проход, поэтому можно передавать генератор из `parse_log`
+    без промежуточного списка.
+
     Args:
-        data (Sequence[ParsedLogEntry]): Последовательность с распарсенными данными.
+        data (Iterable[tuple[str, float]]): Распарсенные записи лога (URL, request_time).
+        report_size (int | None): Сколько URL с наибольшим `time_sum` вернуть. По умолчанию все.
 
     Returns:
         Sequence[StatisticEntry]: Отсортированный список статистики по URL.
     """
-    url_stats: dict[str, URLStatistic] = {}
-    total_requests = len(data)
-    total_time = sum(entry.request_time for entry in data)
+    # На каждую строку выполняется только поиск массива значений URL и `append`: сумма, максимум
+    # и медиана считаются после прохода встроенными функциями по массиву каждого URL.
+    times_by_url: dict[str, array[float]] = {}
+    get_times = times_by_url.get
 
-    for entry in data:
-        if entry.url not in url_stats:
-            url_stats[entry.url] = URLStatistic(url=entry.url)
+    for url, request_time in data:
+        times = get_times(url)
+        if times is None:
+            times = times_by_url[url] = array('d')
+        times.append(request_time)
 
-        url_stats[entry.url].add_request(entry.request_time)
+    return calculate_statistics_from_times(times_by_url, report_size)
 
+
+def calculate_statistics_from_times(
+    times_by_url: 'Mapping[str, Sequence[float]]',
+    report_size: int | None = None,
+) -> 'Sequence[StatisticEntry]':
+    """Вычисляет статистику по значениям request_time, уже сгруппированным по URL.
+
+    Принимает результат `parse_log_parallel` и группировку из `calculate_statistics`: сумма
+    и максимум считаются встроенными `sum` и `max` по каждому массиву на уровне C.
+
+    Args:
+        times_by_url (Mapping[str, Sequence[float]]): Значения request_time по URL.
+        report_size (int | None): Сколько URL с наибольшим `time_sum` вернуть. По умолчанию все.
+
+    Returns:
+        Sequence[StatisticEntry]: Отсортированный список статистики по URL.
+    """
+    urls = [url for url, times in times_by_url.items() if times]
+    times_list = [times_by_url[url] for url in urls]
+    time_sums = [sum(times) for times in times_list]
+    time_maxes = [max(times) for times in times_list]
+    return _build_entries(urls, times_list, time_sums, time_maxes, report_size)
+
+
+def _build_entries(
+    urls: 'Sequence[str]',
+    times_by_url: 'Sequence[Sequence[float]]',
+    time_sums: 'Sequence[float]',
+    time_maxes: 'Sequence[float]',
+    report_size: int | None,
+) -> 'Sequence[StatisticEntry]':
+    """Отбирает URL с наибольшим `time_sum` и собирает для них записи статистики.
+
+    Все последовательности параллельны: i-й элемент каждой относится к `urls[i]`.
+    """
+    scales = (_percent_scale(sum(len(times) for times in times_by_url)), _percent_scale(sum(time_sums)))
+
+    # Сначала отбираются индексы URL с наибольшим `time_sum`: медиана и остальные метрики
+    # считаются только для URL, попадающих в отчет.
+    indexes = range(len(urls))
+    if report_size is None:
+        top_indexes = sorted(indexes, key=time_sums.__getitem__, reverse=True)
+    else:
+        top_indexes = heapq.nlargest(report_size, indexes, key=time_sums.__getitem__)
+
+    # Кортеж собирается из готового списка, а не из генератора
     return tuple(
-        sorted(
-            (stat.compute_metrics(total_requests, total_time) for stat in url_stats.values()),
-            key=lambda x: x['time_sum'],
-            reverse=True,
-        )
+        [
+            _statistic_entry(
+                urls[index],
+                len(times_by_url[index]),
+                time_sums[index],
+                time_maxes[index],
+                _median(times_by_url[index]),
+                scales,
+            )
+            for index in top_indexes
+        ]
     )
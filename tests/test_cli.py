@@ -33,6 +33,27 @@ def test_parse_args_with_config(monkeypatch: 'MonkeyPatch', tmp_path: Path) -> N
     assert args.config == config_file
 
 
+def test_parse_args_with_config_equals_form(monkeypatch: 'MonkeyPatch', tmp_path: Path) -> None:
+    """Тест: передача --config=PATH одним аргументом."""
+    config_file = tmp_path / 'config.toml'
+
+    monkeypatch.setattr(sys, 'argv', ['nginx_log_analyzer', f'--config={config_file}'])
+
+    args = parse_args()
+
+    assert args.config == config_file
+
+
+def test_parse_args_help_exits_successfully(monkeypatch: 'MonkeyPatch') -> None:
+    """Тест: --help обрабатывается argparse и завершает программу с кодом 0."""
+    monkeypatch.setattr(sys, 'argv', ['nginx_log_analyzer', '--help'])
+
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args()
+
+    assert exc_info.value.code == 0
+
+
 def test_parse_args_with_nonexistent_config(monkeypatch: 'MonkeyPatch') -> None:
     """Тест: передача --config с несуществующим файлом должна просто передать путь."""
     fake_path = Path('/non/existing/config.toml')
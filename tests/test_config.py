@@ -1,3 +1,4 @@
+import os
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -10,12 +11,15 @@ from src.nginx_log_analyzer.config import (
     DEFAULT_LOG_DIR,
     DEFAULT_REPORT_DIR,
     DEFAULT_REPORT_SIZE,
+    DEFAULT_REPORT_TEMPLATE_PATH,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Generator
     from typing import Any
 
+    from pytest_mock import MockerFixture
+
 
 @pytest.fixture
 def valid_config() -> 'Generator[Path, None, None]':
@@ -110,3 +114,73 @@ def test_default_values() -> None:
     assert config.report_size == DEFAULT_REPORT_SIZE
     assert config.error_threshold == DEFAULT_ERROR_THRESHOLD
     assert config.log_file is None
+
+
+def test_from_dict_uses_default_template_path(tmp_path: Path) -> None:
+    """Тест: конфигурация со слотами получает путь к шаблону по умолчанию."""
+    config = ConfigModel.from_dict({'log_dir': tmp_path, 'report_dir': tmp_path})
+
+    assert config.report_template_path == DEFAULT_REPORT_TEMPLATE_PATH
+    assert not hasattr(config, '__dict__')
+
+
+def test_from_toml_reuses_unchanged_file(mocker: 'MockerFixture', tmp_path: Path) -> None:
+    """Тест повторной загрузки: неизмененный файл не разбирается заново, измененный — разбирается."""
+    expected_report_size = 20
+    expected_reads = 2
+    (tmp_path / 'logs').mkdir()
+    (tmp_path / 'reports').mkdir()
+    config_path = tmp_path / 'config.toml'
+    config_path.write_text('report_size = 10', encoding='utf-8')
+    read_toml_spy = mocker.spy(ConfigModel, '_read_toml')
+
+    first = ConfigModel.from_toml(config_path)
+
+    assert ConfigModel.from_toml(config_path) == first
+    read_toml_spy.assert_called_once()
+
+    config_path.write_text(f'report_size = {expected_report_size}', encoding='utf-8')
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = ConfigModel.from_toml(config_path)
+
+    assert read_toml_spy.call_count == expected_reads
+    assert reloaded.report_size == expected_report_size
+
+
+def test_from_toml_reloads_file_with_same_mtime_and_new_size(mocker: 'MockerFixture', tmp_path: Path) -> None:
+    """Тест: изменение размера файла сбрасывает кэш даже при том же времени изменения."""
+    expected_report_size = 200
+    (tmp_path / 'logs').mkdir()
+    (tmp_path / 'reports').mkdir()
+    config_path = tmp_path / 'config.toml'
+    config_path.write_text('report_size = 10', encoding='utf-8')
+    stat = config_path.stat()
+
+    ConfigModel.from_toml(config_path)
+
+    config_path.write_text(f'report_size = {expected_report_size}', encoding='utf-8')
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert ConfigModel.from_toml(config_path).report_size == expected_report_size
+
+    read_toml_spy = mocker.spy(ConfigModel, '_read_toml')
+    ConfigModel.clear_cache()
+    ConfigModel.from_toml(config_path)
+
+    read_toml_spy.assert_called_once()
+
+
+def test_from_toml_revalidates_cached_file(tmp_path: Path) -> None:
+    """Тест: каталог, удаленный после первой загрузки, обнаруживается и для неизмененного файла."""
+    (tmp_path / 'logs').mkdir()
+    (tmp_path / 'reports').mkdir()
+    config_path = tmp_path / 'config.toml'
+    config_path.write_text('report_size = 10', encoding='utf-8')
+
+    ConfigModel.from_toml(config_path)
+    (tmp_path / 'reports').rmdir()
+
+    with pytest.raises(ValueError, match='report_dir'):
+        ConfigModel.from_toml(config_path)
@@ -6,7 +6,16 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from src.nginx_log_analyzer.log_parser import find_latest_log, LogFileType, parse_log, ParsedLogEntry, unzip_if_needed
+from src.nginx_log_analyzer.log_parser import (
+    _parse_chunk,
+    find_latest_log,
+    LogFileType,
+    parse_line,
+    parse_log,
+    parse_log_parallel,
+    ParsedLogEntry,
+    unzip_if_needed,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -14,14 +23,14 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
-def log_generator(log_lines: list[str]) -> 'Generator[str, None, None]':
+def log_generator(log_lines: list[bytes]) -> 'Generator[bytes, None, None]':
     """Генерирует строки логов.
 
     Args:
-        log_lines (list[str]): Список строк логов.
+        log_lines (list[bytes]): Список строк логов.
 
     Yields:
-        Generator[str, None, None]: Генератор строк логов.
+        Generator[bytes, None, None]: Генератор строк логов.
     """
     yield from log_lines
 
@@ -76,6 +85,17 @@ def test_find_latest_log(temp_log_dir: Path) -> None:
     assert latest_log.file_type == LogFileType.GZ, 'Тип файла должен быть `.gz`'
 
 
+def test_find_latest_log_ignores_directories(temp_log_dir: Path) -> None:
+    """Проверяет, что директория с именем лог-файла не считается логом."""
+    (temp_log_dir / 'nginx-access-ui.log-20250201').touch()
+    (temp_log_dir / 'nginx-access-ui.log-20250202').mkdir()
+
+    latest_log = find_latest_log(temp_log_dir)
+
+    assert latest_log is not None, 'Лог-файл должен быть найден'
+    assert latest_log.path.name == 'nginx-access-ui.log-20250201', 'Директория не должна выбираться как лог'
+
+
 def test_find_latest_log_no_logs(temp_log_dir: Path) -> None:
     """Проверяет, если логов в директории нет.
 
@@ -98,11 +118,27 @@ def test_unzip_if_needed_plain_file() -> None:
         file_path = Path(temp_file.name)
         lines = list(unzip_if_needed(file_path))
 
-        assert lines == ['Line 1\n', 'Line 2\n'], 'Ожидается, что содержимое файла будет прочитано построчно'
+        assert lines == [b'Line 1\n', b'Line 2\n'], 'Ожидается, что содержимое файла будет прочитано построчно'
 
         file_path.unlink()  # Удаляем файл после теста
 
 
+def test_unzip_if_needed_empty_plain_file(temp_log_dir: Path) -> None:
+    """Проверяет, что пустой текстовый файл читается без ошибок и не дает строк."""
+    file_path = temp_log_dir / 'nginx-access-ui.log-20240101'
+    file_path.touch()
+
+    assert list(unzip_if_needed(file_path)) == []
+
+
+def test_unzip_if_needed_last_line_without_newline(temp_log_dir: Path) -> None:
+    """Проверяет, что последняя строка без перевода строки тоже читается."""
+    file_path = temp_log_dir / 'nginx-access-ui.log-20240101'
+    file_path.write_bytes(b'Line 1\nLine 2')
+
+    assert list(unzip_if_needed(file_path)) == [b'Line 1\n', b'Line 2']
+
+
 def test_unzip_if_needed_gz_file() -> None:
     """Проверяет на чтение `.gz` файла.
 
@@ -119,13 +155,39 @@ def test_unzip_if_needed_gz_file() -> None:
 
         lines = list(unzip_if_needed(temp_file_path))
 
-        expected = ['Compressed Line 1\n', 'Compressed Line 2\n']
+        expected = [b'Compressed Line 1\n', b'Compressed Line 2\n']
         assert lines == expected, f'Ожидаемый результат {expected}, но получен {lines}'
 
     finally:
         temp_file_path.unlink(missing_ok=True)
 
 
+@pytest.mark.parametrize(
+    'line, expected',
+    [
+        (
+            b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150\n',
+            ParsedLogEntry(url='/api/data', request_time=0.150),
+        ),
+        (
+            b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "POST /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150 \n',
+            ParsedLogEntry(url='/api/data', request_time=0.150),
+        ),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "BREW /pot HTTP/1.1" 418 0 "-" "-" "-" "-" "-" 0.150\n', None),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-"\n', None),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /a HTTP/1.1" 200 927\n', None),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /a HTTP/1.1" 200 927 "-" "-" "-" "-" "-" nan\n', None),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /a HTTP/1.1" 200 927 "-" "-" "-" "-" "-" inf\n', None),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /a HTTP/1.1" 200 927 "-" "-" "-" "-" "-" 1e3\n', None),
+        (b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET  HTTP/1.1" 200 927 "-" "-" "-" "-" "-" 0.500\n', None),
+        (b'INVALID LOG LINE', None),
+    ],
+)
+def test_parse_line(line: bytes, expected: ParsedLogEntry | None) -> None:
+    """Проверяет разбор отдельной строки, включая запасной разбор регулярным выражением."""
+    assert parse_line(line) == expected
+
+
 def test_parse_log_valid_entries() -> None:
     """Тест на успешный разбор строк логов.
 
@@ -133,11 +195,11 @@ def test_parse_log_valid_entries() -> None:
     """
     log_lines = log_generator(
         [
-            """1.196.116.32 -  - [29/Jun/2017:03:50:22 +0300]
+            b"""1.196.116.32 -  - [29/Jun/2017:03:50:22 +0300]
             "GET /api/v2/banner/25019354 HTTP/1.1" 200 927 "-"
             "Lynx/2.8.8dev.9 libwww-FM/2.14 SSL-MM/1.4.1 GNUTLS/2.10.5"
             "-" "1498697422-2190034393-4708-9752759" "dc7161be3" 0.390""",
-            """1.99.174.176 3b81f63526fa8  - [29/Jun/2017:03:50:22 +0300]
+            b"""1.99.174.176 3b81f63526fa8  - [29/Jun/2017:03:50:22 +0300]
             "GET /api/1/photogenic_banners/list/?server_name=WIN7RB4 HTTP/1.1" 200 12
             "-" "Python-urllib/2.7" "-" "1498697422-32900793-4708-9752770" "-" 0.133""",
         ]
@@ -161,11 +223,11 @@ def test_parse_log_with_errors() -> None:
     """
     log_lines = log_generator(
         [
-            'INVALID LOG LINE',
-            '1.196.116.32 -  - [29/Jun/2017:03:50:22 +0300] "GET /api/v2/banner/25019354 HTTP/1.1" 200 927 "-" '
-            '"Lynx/2.8.8dev.9 libwww-FM/2.14 SSL-MM/1.4.1 GNUTLS/2.10.5" "-" "1498697422-2190034393-4708-9752759" '
-            '"dc7161be3" 0.390',
-            'INVALID LOG LINE',
+            b'INVALID LOG LINE',
+            b'1.196.116.32 -  - [29/Jun/2017:03:50:22 +0300] "GET /api/v2/banner/25019354 HTTP/1.1" 200 927 "-" '
+            b'"Lynx/2.8.8dev.9 libwww-FM/2.14 SSL-MM/1.4.1 GNUTLS/2.10.5" "-" "1498697422-2190034393-4708-9752759" '
+            b'"dc7161be3" 0.390',
+            b'INVALID LOG LINE',
         ]
     )
 
@@ -176,6 +238,20 @@ def test_parse_log_with_errors() -> None:
     assert results == expected, f'Ожидаемый результат {expected}, но получен {results}'
 
 
+def test_parse_log_line_without_request_time_is_error() -> None:
+    """Проверяет, что строка без request_time считается ошибкой разбора, а не прерывает обработку."""
+    log_lines = log_generator(
+        [
+            b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150\n',
+            b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-"\n',
+        ]
+    )
+
+    results = list(parse_log(log_lines, error_threshold=0.5))
+
+    assert results == [('/api/data', 0.150)], f'Ожидалась одна корректная запись, получено {results}'
+
+
 def test_parse_log_exceeds_error_threshold() -> None:
     """Тест на выброс исключения, если ошибки парсинга превышают допустимый порог.
 
@@ -183,10 +259,10 @@ def test_parse_log_exceeds_error_threshold() -> None:
     """
     log_lines = log_generator(
         [
-            'INVALID LOG LINE',
-            'INVALID LOG LINE',
-            '1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150',
-            'INVALID LOG LINE',
+            b'INVALID LOG LINE',
+            b'INVALID LOG LINE',
+            b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150',
+            b'INVALID LOG LINE',
         ]
     )
 
@@ -210,9 +286,9 @@ def test_logging_error(mocker: 'MockerFixture') -> None:
 
     log_lines = log_generator(
         [
-            'INVALID LOG LINE',
-            'INVALID LOG LINE',
-            'INVALID LOG LINE',
+            b'INVALID LOG LINE',
+            b'INVALID LOG LINE',
+            b'INVALID LOG LINE',
         ]
     )
 
@@ -234,8 +310,8 @@ def test_parse_log_yields_entries() -> None:
     """Проверяет, что parse_log является генератором и корректно отдает записи."""
     log_lines = log_generator(
         [
-            '1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150',
-            '2.2.2.2 - - [01/Jan/2024:10:01:00 +0000] "GET /api/test HTTP/1.1" 200 456 "-" "-" "-" "-" "-" 0.250',
+            b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150',
+            b'2.2.2.2 - - [01/Jan/2024:10:01:00 +0000] "GET /api/test HTTP/1.1" 200 456 "-" "-" "-" "-" "-" 0.250',
         ]
     )
 
@@ -256,3 +332,63 @@ def test_parse_log_empty_file() -> None:
     parsed_entries = list(parse_log(log_lines, error_threshold=0.1))
 
     assert len(parsed_entries) == 0, 'Пустой файл журнала должен возвращать пустой список'
+
+
+@pytest.mark.parametrize('processes', [2, 3])
+def test_parse_log_parallel_matches_parse_log(temp_log_dir: Path, processes: int) -> None:
+    """Проверяет, что параллельный разбор группирует те же записи, что и последовательный."""
+    log_lines = [
+        b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 123 "-" "-" "-" "-" "-" 0.150\n',
+        b'2.2.2.2 - - [01/Jan/2024:10:01:00 +0000] "GET /api/test HTTP/1.1" 200 456 "-" "-" "-" "-" "-" 0.250\n',
+        b'INVALID LOG LINE\n',
+    ] * 20
+    file_path = temp_log_dir / 'nginx-access-ui.log-20240101'
+    file_path.write_bytes(b''.join(log_lines))
+
+    expected: dict[str, list[float]] = {}
+    for url, request_time in parse_log(log_lines, error_threshold=0.5):
+        expected.setdefault(url, []).append(request_time)
+
+    result = parse_log_parallel(file_path, error_threshold=0.5, processes=processes)
+
+    assert {url: list(times) for url, times in result.items()} == expected
+
+
+def test_parse_log_parallel_exceeds_error_threshold(temp_log_dir: Path) -> None:
+    """Проверяет, что параллельный разбор проверяет порог ошибок по всему файлу."""
+    file_path = temp_log_dir / 'nginx-access-ui.log-20240101'
+    file_path.write_bytes(b'INVALID LOG LINE\n' * 10)
+
+    with pytest.raises(ValueError, match='Превышен порог ошибок'):
+        parse_log_parallel(file_path, error_threshold=0.1, processes=2)
+
+
+def test_parse_chunk_reads_whole_line_at_split_boundary(temp_log_dir: Path) -> None:
+    """Проверяет, что диапазон, граница которого попадает внутрь строки, дочитывает ее до конца."""
+    log_lines = [
+        b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /first HTTP/1.1" 200 1 "-" "-" "-" "-" "-" 0.100\n',
+        b'1.1.1.1 - - [01/Jan/2024:10:00:01 +0000] "GET /second HTTP/1.1" 200 1 "-" "-" "-" "-" "-" 0.200\n',
+        b'1.1.1.1 - - [01/Jan/2024:10:00:02 +0000] "GET /third HTTP/1.1" 200 1 "-" "-" "-" "-" "-" 0.300\n',
+    ]
+    file_path = temp_log_dir / 'nginx-access-ui.log-20240101'
+    file_path.write_bytes(b''.join(log_lines))
+    split = len(log_lines[0]) + len(log_lines[1]) // 2
+    next_start = len(log_lines[0]) + len(log_lines[1])
+
+    first_times, first_lines, first_errors = _parse_chunk(file_path, 0, split)
+    second_times, second_lines, second_errors = _parse_chunk(file_path, next_start, len(b''.join(log_lines)))
+
+    assert {url: list(times) for url, times in first_times.items()} == {'/first': [0.1], '/second': [0.2]}
+    assert {url: list(times) for url, times in second_times.items()} == {'/third': [0.3]}
+    assert (first_lines, first_errors, second_lines, second_errors) == (2, 0, 1, 0)
+
+
+def test_parse_chunk_stops_at_end_of_truncated_file(temp_log_dir: Path) -> None:
+    """Проверяет, что разбор диапазона завершается, если файл короче ожидаемой границы."""
+    file_path = temp_log_dir / 'nginx-access-ui.log-20240101'
+    file_path.write_bytes(b'INVALID LOG LINE\n' * 3)
+
+    times_by_url, total_lines, errors = _parse_chunk(file_path, 0, 10_000)
+
+    assert times_by_url == {}
+    assert (total_lines, errors) == (3, 3)
@@ -0,0 +1,34 @@
+import logging
+import sys
+from typing import TYPE_CHECKING
+
+from src.nginx_log_analyzer import logger as logger_module
+from src.nginx_log_analyzer.logger import configure_logging
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+
+def test_configure_logging_runs_once(mocker: 'MockerFixture', monkeypatch: 'MonkeyPatch', tmp_path: 'Path') -> None:
+    """Тест: повторная настройка логирования, в том числе с другим log_file, ничего не меняет."""
+    log_file = tmp_path / 'app.log'
+    log_file.touch()
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers[:]
+
+    monkeypatch.setitem(logger_module._LOGGING_STATE, 'configured', False)
+    monkeypatch.setattr(sys, 'excepthook', sys.excepthook)
+    configure_mock = mocker.patch('src.nginx_log_analyzer.logger.structlog.configure')
+
+    try:
+        configure_logging(log_file=None)
+        handlers_after_first = root_logger.handlers[:]
+        configure_logging(log_file=log_file)
+
+        configure_mock.assert_called_once()
+        assert root_logger.handlers == handlers_after_first
+    finally:
+        root_logger.handlers[:] = original_handlers
@@ -0,0 +1,39 @@
+import json
+from typing import TYPE_CHECKING
+
+from src.nginx_log_analyzer import main as main_module
+from src.nginx_log_analyzer.config import ConfigModel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+
+def test_main_parses_large_plain_log_in_parallel(
+    mocker: 'MockerFixture', monkeypatch: 'MonkeyPatch', tmp_path: 'Path'
+) -> None:
+    """Тест: несжатый лог не меньше `PARALLEL_MIN_FILE_SIZE` разбирается параллельно и дает отчет."""
+    log_dir = tmp_path / 'logs'
+    report_dir = tmp_path / 'reports'
+    log_dir.mkdir()
+    report_dir.mkdir()
+    (log_dir / 'nginx-access-ui.log-20240101').write_bytes(
+        b'1.1.1.1 - - [01/Jan/2024:10:00:00 +0000] "GET /api/data HTTP/1.1" 200 1 "-" "-" "-" "-" "-" 0.150\n' * 10
+    )
+    template_path = tmp_path / 'report.html'
+    template_path.write_text('$table_json', encoding='utf-8')
+
+    config = ConfigModel(log_dir=log_dir, report_dir=report_dir, report_template_path=template_path)
+    monkeypatch.setattr(main_module, 'config', config, raising=False)
+    monkeypatch.setattr(main_module, 'PARALLEL_MIN_FILE_SIZE', 0)
+    parallel_spy = mocker.spy(main_module, 'parse_log_parallel')
+    sequential_spy = mocker.spy(main_module, 'parse_log')
+
+    main_module.main()
+
+    parallel_spy.assert_called_once()
+    sequential_spy.assert_not_called()
+    report = json.loads((report_dir / 'report-2024.01.01.html').read_text(encoding='utf-8'))
+    assert [(entry['url'], entry['count']) for entry in report] == [('/api/data', 10)]
@@ -47,8 +47,9 @@ def test_generate_report_creates_file(tmp_path: 'Path') -> None:
     assert report_path.exists()
     generated_content = report_path.read_text(encoding='utf-8')
 
-    expected_json = json.dumps(report_data, ensure_ascii=False, indent=2)
+    expected_json = json.dumps(report_data, ensure_ascii=False)
     assert f'<html><body>{expected_json}</body></html>' == generated_content
+    assert not list(tmp_path.glob('*.tmp'))
 
 
 def test_generate_report_logs_error_if_template_missing(mocker: 'MockerFixture', tmp_path: 'Path') -> None:
@@ -69,3 +70,44 @@ def test_generate_report_logs_error_if_template_missing(mocker: 'MockerFixture',
     )
 
     assert not report_path.exists()
+
+
+def test_generate_report_reads_template_once(mocker: 'MockerFixture', tmp_path: 'Path') -> None:
+    """Проверяет, что шаблон читается с диска один раз при повторной генерации отчетов."""
+    report_template_path = tmp_path / 'cached_template.html'
+    report_template_path.write_text('<html>$table_json</html>', encoding='utf-8')
+
+    read_bytes_spy = mocker.spy(type(report_template_path), 'read_bytes')
+
+    generate_report([], tmp_path / 'first.html', report_template_path)
+    generate_report([], tmp_path / 'second.html', report_template_path)
+
+    read_bytes_spy.assert_called_once()
+    assert (tmp_path / 'second.html').read_text(encoding='utf-8') == '<html>[]</html>'
+
+
+def test_generate_report_keeps_no_partial_report_on_write_error(mocker: 'MockerFixture', tmp_path: 'Path') -> None:
+    """Проверяет, что при ошибке записи не остается ни отчета, ни временного файла."""
+    report_path = tmp_path / 'failed_report.html'
+    report_template_path = tmp_path / 'failed_template.html'
+    report_template_path.write_text('<html>$table_json</html>', encoding='utf-8')
+
+    mocker.patch('src.nginx_log_analyzer.report_generator.os.replace', side_effect=OSError('disk full'))
+
+    with pytest.raises(OSError, match='disk full'):
+        generate_report([], report_path, report_template_path)
+
+    assert not report_path.exists()
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_generate_report_rereads_changed_template(tmp_path: 'Path') -> None:
+    """Проверяет, что измененный шаблон перечитывается при следующей генерации отчета."""
+    report_template_path = tmp_path / 'changing_template.html'
+    report_template_path.write_text('<p>$table_json</p>', encoding='utf-8')
+    generate_report([], tmp_path / 'first.html', report_template_path)
+
+    report_template_path.write_text('<div>$table_json</div>', encoding='utf-8')
+    generate_report([], tmp_path / 'second.html', report_template_path)
+
+    assert (tmp_path / 'second.html').read_text(encoding='utf-8') == '<div>[]</div>'
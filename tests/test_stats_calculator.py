@@ -1,7 +1,12 @@
+from array import array
 from statistics import median
 
 from src.nginx_log_analyzer.log_parser import ParsedLogEntry
-from src.nginx_log_analyzer.stats_calculator import calculate_statistics, URLStatistic
+from src.nginx_log_analyzer.stats_calculator import (
+    calculate_statistics,
+    calculate_statistics_from_times,
+    URLStatistic,
+)
 
 
 def test_url_statistic_operations() -> None:
@@ -26,6 +31,28 @@ def test_url_statistic_operations() -> None:
     assert stat.time_median == expected_time_median
 
 
+def test_url_statistic_median_after_each_request() -> None:
+    """Тест: медиана URLStatistic верна после каждого добавленного запроса."""
+    request_times = [0.5, 0.1, 0.9, 0.3, 0.3, 0.7, 0.2, 1.5]
+    stat = URLStatistic(url='/api/stream')
+
+    for added, request_time in enumerate(request_times, start=1):
+        stat.add_request(request_time)
+        assert stat.time_median == median(request_times[:added])
+
+
+def test_url_statistic_compute_metrics_matches_calculate_statistics() -> None:
+    """Тест: URLStatistic.compute_metrics дает ту же запись, что и calculate_statistics."""
+    request_times = [0.4, 0.1, 0.3, 0.2]
+    stat = URLStatistic(url='/api/same')
+    for request_time in request_times:
+        stat.add_request(request_time)
+
+    expected = calculate_statistics([('/api/same', request_time) for request_time in request_times])
+
+    assert stat.compute_metrics(total_requests=len(request_times), total_time=stat.time_sum) == expected[0]
+
+
 def test_calculate_statistics_basic() -> None:
     """Тест: стандартная обработка нескольких URL."""
     expected_unique_urls = 2
@@ -122,3 +149,76 @@ def test_calculate_statistics_large_numbers() -> None:
     assert result[0]['time_avg'] == expected_time_avg
     assert result[0]['time_max'] == expected_time_max
     assert result[0]['time_med'] == expected_time_median
+
+
+def test_calculate_statistics_accepts_generator() -> None:
+    """Тест: статистика считается за один проход по генератору записей."""
+    expected_count = 3
+    expected_time_max = 0.5
+    expected_time_perc = 100.0
+
+    parsed_data = (ParsedLogEntry(url='/stream', request_time=request_time) for request_time in (0.1, 0.5, 0.2))
+
+    result = calculate_statistics(parsed_data)
+
+    assert len(result) == 1
+    assert result[0]['count'] == expected_count
+    assert result[0]['time_max'] == expected_time_max
+    assert result[0]['time_perc'] == expected_time_perc
+
+
+def test_calculate_statistics_even_count_median() -> None:
+    """Тест: медиана для четного количества запросов равна среднему двух центральных значений."""
+    parsed_data = [
+        ParsedLogEntry(url='/even', request_time=0.4),
+        ParsedLogEntry(url='/even', request_time=0.1),
+        ParsedLogEntry(url='/even', request_time=0.3),
+        ParsedLogEntry(url='/even', request_time=0.2),
+    ]
+
+    result = calculate_statistics(parsed_data)
+
+    assert result[0]['time_med'] == median([0.4, 0.1, 0.3, 0.2])
+
+
+def test_calculate_statistics_report_size() -> None:
+    """Тест: при заданном report_size возвращаются только URL с наибольшим time_sum."""
+    report_size = 2
+    expected_total_requests = 4
+
+    parsed_data = [
+        ParsedLogEntry(url='/slow', request_time=3.0),
+        ParsedLogEntry(url='/fast', request_time=0.1),
+        ParsedLogEntry(url='/medium', request_time=1.0),
+        ParsedLogEntry(url='/medium', request_time=1.5),
+    ]
+
+    result = calculate_statistics(parsed_data, report_size=report_size)
+
+    assert [entry['url'] for entry in result] == ['/slow', '/medium']
+    assert sum(entry['count_perc'] for entry in result) == (expected_total_requests - 1) / expected_total_requests * 100
+
+
+def test_calculate_statistics_from_times_matches_calculate_statistics() -> None:
+    """Тест: статистика по сгруппированным значениям совпадает со статистикой по записям."""
+    parsed_data = [('/slow', 3.0), ('/fast', 0.5), ('/medium', 1.0), ('/medium', 1.5)]
+
+    times_by_url: dict[str, array[float]] = {}
+    for url, request_time in parsed_data:
+        times_by_url.setdefault(url, array('d')).append(request_time)
+
+    assert calculate_statistics_from_times(times_by_url, report_size=2) == calculate_statistics(
+        parsed_data, report_size=2
+    )
+
+
+def test_calculate_statistics_small_group_medians() -> None:
+    """Тест: медиана для URL с одним, двумя и тремя запросами совпадает с statistics.median."""
+    times_by_url = {'/one': [0.7], '/two': [0.3, 0.1], '/three': [0.9, 0.2, 0.4]}
+    parsed_data = [(url, request_time) for url, times in times_by_url.items() for request_time in times]
+
+    result = calculate_statistics(parsed_data)
+
+    assert {entry['url']: entry['time_med'] for entry in result} == {
+        url: median(times) for url, times in times_by_url.items()
+    }